@@ -1,38 +1,70 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, Body
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Body, Response
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
+from bisect import bisect_right
+import asyncio
+import base64
+import hashlib
+import hmac
 import os
 import logging
+import time
 from pathlib import Path
 from pydantic import BaseModel, Field
 from typing import List, Optional
 import uuid
 import bcrypt
 import jwt
+import msgspec
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from pymongo import UpdateOne
 from enum import Enum
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection - explicit pool bounds keep tail latency predictable
+# under concurrency instead of relying on driver defaults
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=50,
+    minPoolSize=10,
+    serverSelectionTimeoutMS=2000,
+)
 db = client[os.environ['DB_NAME']]
 
-# Create the main app without a prefix
-app = FastAPI()
+# Create the main app without a prefix - orjson serializes responses several
+# times faster than the stdlib json encoder
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
 security = HTTPBearer()
 
-# JWT Configuration
-SECRET_KEY = "your-secret-key-here"
-ALGORITHM = "HS256"
+# JWT Configuration - Ed25519 signatures are cheap to verify and, unlike the
+# old shared HS256 secret, let an edge proxy or another service verify tokens
+# with just the public key (published at /api/.well-known/jwks.json)
+ALGORITHM = "EdDSA"
+_jwt_key_pem = os.environ.get("JWT_PRIVATE_KEY")
+if _jwt_key_pem:
+    _jwt_private_key = serialization.load_pem_private_key(
+        _jwt_key_pem.encode(), password=None
+    )
+else:
+    # Dev fallback: ephemeral key, issued tokens do not survive a restart
+    _jwt_private_key = ed25519.Ed25519PrivateKey.generate()
+_jwt_public_key = _jwt_private_key.public_key()
 
 # Models
 class UserRole(str, Enum):
@@ -46,13 +78,13 @@ class LoyaltyTier(str, Enum):
     PLATINUM = "platinum"
 
 class Category(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     description: str
     image_url: Optional[str] = None
 
 class Product(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     description: str
     price: float
@@ -63,12 +95,13 @@ class Product(BaseModel):
     stock_quantity: int = 0
     warranty_months: int = 12
     rating: float = 0.0
+    rating_sum: int = 0
     review_count: int = 0
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     is_active: bool = True
 
 class User(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     email: str
     name: str
     phone: Optional[str] = None
@@ -77,7 +110,7 @@ class User(BaseModel):
     loyalty_points: int = 0
     loyalty_tier: LoyaltyTier = LoyaltyTier.BRONZE
     total_spent: float = 0.0
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     is_active: bool = True
 
 class CartItem(BaseModel):
@@ -85,7 +118,7 @@ class CartItem(BaseModel):
     quantity: int = 1
 
 class Order(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     items: List[dict]
     total_amount: float
@@ -96,15 +129,15 @@ class Order(BaseModel):
     payment_status: str = "pending"
     order_status: str = "placed"
     shipping_address: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class Review(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     product_id: str
     user_id: str
     rating: int = Field(..., ge=1, le=5)
     comment: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 # Request/Response Models
 class UserCreate(BaseModel):
@@ -138,47 +171,163 @@ class ReviewCreate(BaseModel):
     rating: int = Field(..., ge=1, le=5)
     comment: str
 
+# msgspec Structs for the hot list reads: converting a DB document into a
+# Struct and encoding it with msgspec's C JSON encoder is an order of
+# magnitude cheaper than Pydantic construction + re-serialization. Request
+# bodies stay on Pydantic where validation actually matters.
+class ProductOut(msgspec.Struct):
+    id: str
+    name: str
+    description: str
+    price: float
+    brand: str
+    category: str
+    image_url: str
+    specifications: dict = {}
+    stock_quantity: int = 0
+    warranty_months: int = 12
+    rating: float = 0.0
+    review_count: int = 0
+    created_at: Optional[datetime] = None
+    is_active: bool = True
+
+class OrderOut(msgspec.Struct):
+    id: str
+    user_id: str
+    items: List[dict]
+    total_amount: float
+    shipping_address: str
+    discount_amount: float = 0.0
+    loyalty_points_used: int = 0
+    loyalty_points_earned: int = 0
+    payment_method: str = "UPI"
+    payment_status: str = "pending"
+    order_status: str = "placed"
+    created_at: Optional[datetime] = None
+
+class ReviewOut(msgspec.Struct):
+    id: str
+    product_id: str
+    user_id: str
+    rating: int
+    comment: str
+    created_at: Optional[datetime] = None
+
+def _json_response(payload) -> Response:
+    return Response(content=msgspec.json.encode(payload), media_type="application/json")
+
+# BSON projections matching the response models - keeps Mongo from shipping
+# the _id and any stray fields the API never returns
+_CATEGORY_PROJECTION = {field: 1 for field in Category.model_fields} | {"_id": 0}
+# rating_sum is write-side bookkeeping for the review pipeline - never ship it
+_PRODUCT_PROJECTION = {field: 1 for field in Product.model_fields if field != "rating_sum"} | {"_id": 0}
+_ORDER_PROJECTION = {field: 1 for field in Order.model_fields} | {"_id": 0}
+_REVIEW_PROJECTION = {field: 1 for field in Review.model_fields} | {"_id": 0}
+
+# Thread pool for password hashing - it is 100ms+ of pure CPU and would
+# otherwise block the event loop for every concurrent request
+_hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Argon2id for new hashes: memory-hard, GPU-resistant and tunable in memory
+# rather than just time. Existing bcrypt rows verify via the legacy path and
+# are upgraded on their next successful login. Costs come from the environment
+# so they can be raised (or lowered for high-throughput deployments) without a
+# code change; a pepper plus a modest cost is stronger than a high cost alone.
+ARGON2_TIME_COST = int(os.environ.get("ARGON2_TIME_COST", "2"))
+ARGON2_MEMORY_COST = int(os.environ.get("ARGON2_MEMORY_COST", "19456"))
+_password_hasher = PasswordHasher(
+    time_cost=ARGON2_TIME_COST, memory_cost=ARGON2_MEMORY_COST, parallelism=1
+)
+
+# Optional application-level pepper, kept in the environment and never in the
+# database, so a dumped users collection alone cannot be attacked offline.
+# Must be set before the first user registers; rotating it requires a rehash.
+PASSWORD_PEPPER = os.environ.get("PASSWORD_PEPPER", "").encode()
+
+def _prehash(password: str) -> str:
+    if not PASSWORD_PEPPER:
+        return password
+    return hmac.new(PASSWORD_PEPPER, password.encode('utf-8'), hashlib.sha256).hexdigest()
+
 # Helper functions
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+async def hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, _password_hasher.hash, _prehash(password))
+
+async def verify_password(password: str, hashed: str) -> bool:
+    loop = asyncio.get_running_loop()
+    if hashed.startswith("$argon2"):
+        try:
+            return await loop.run_in_executor(
+                _hash_pool, _password_hasher.verify, hashed, _prehash(password)
+            )
+        except VerifyMismatchError:
+            return False
+    # Legacy bcrypt hash from before the argon2 migration
+    return await loop.run_in_executor(
+        _hash_pool, bcrypt.checkpw, password.encode('utf-8'), hashed.encode('utf-8')
+    )
+
+# Verified against when a login hits an unknown email, so the response takes
+# as long as a real failed login and timing cannot reveal account existence
+_DUMMY_HASH = _password_hasher.hash("dummy-password")
 
-def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+def password_needs_rehash(hashed: str) -> bool:
+    return not hashed.startswith("$argon2") or _password_hasher.check_needs_rehash(hashed)
 
 def create_jwt_token(data: dict):
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(hours=24)
+    expire = datetime.now(timezone.utc) + timedelta(hours=24)
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _jwt_private_key, algorithm=ALGORITHM)
+
+# Short-lived auth cache: skips jwt.decode + the users round-trip on every
+# authenticated request. Keyed by a hash of the token, never the raw token.
+AUTH_CACHE_TTL = 30
+_auth_cache = TTLCache(maxsize=10000, ttl=AUTH_CACHE_TTL)
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    cache_key = hashlib.sha256(credentials.credentials.encode()).digest()
+    cached = _auth_cache.get(cache_key)
+    if cached is not None:
+        user, expires_at = cached
+        if time.time() < expires_at:
+            return user
+        del _auth_cache[cache_key]
+
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(credentials.credentials, _jwt_public_key, algorithms=[ALGORITHM])
         user_id = payload.get("user_id")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-        
+
         user = await db.users.find_one({"id": user_id})
         if user is None:
             raise HTTPException(status_code=401, detail="User not found")
-        
-        return User(**user)
+
+        user = User(**user)
+        # Never serve a cached entry past the token's own expiry
+        _auth_cache[cache_key] = (user, min(time.time() + AUTH_CACHE_TTL, payload["exp"]))
+        return user
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
 
+# Tier thresholds in ascending spend order - new tiers only need a new row here
+_TIER_THRESHOLDS = (
+    (0, LoyaltyTier.BRONZE),
+    (10000, LoyaltyTier.SILVER),
+    (25000, LoyaltyTier.GOLD),
+    (50000, LoyaltyTier.PLATINUM),
+)
+_TIER_KEYS = [threshold for threshold, _ in _TIER_THRESHOLDS]
+
 def calculate_loyalty_tier(total_spent: float) -> LoyaltyTier:
-    if total_spent >= 50000:
-        return LoyaltyTier.PLATINUM
-    elif total_spent >= 25000:
-        return LoyaltyTier.GOLD
-    elif total_spent >= 10000:
-        return LoyaltyTier.SILVER
-    else:
-        return LoyaltyTier.BRONZE
+    return _TIER_THRESHOLDS[bisect_right(_TIER_KEYS, total_spent) - 1][1]
 
 def calculate_loyalty_points(amount: float) -> int:
-    # 1 point per 100 rupees spent
-    return int(amount // 100)
+    # 1 point per 100 rupees spent; count in paise so float drift in the
+    # rupee amount can never swallow or mint a point
+    return round(amount * 100) // 10000
 
 # Routes
 
@@ -186,6 +335,22 @@ def calculate_loyalty_points(amount: float) -> int:
 async def root():
     return {"message": "ElectroMart API - Your Electronics Store"}
 
+@api_router.get("/.well-known/jwks.json")
+async def jwks():
+    # Public verification key for edge proxies / sibling services
+    raw = _jwt_public_key.public_bytes(
+        serialization.Encoding.Raw, serialization.PublicFormat.Raw
+    )
+    return {
+        "keys": [{
+            "kty": "OKP",
+            "crv": "Ed25519",
+            "alg": "EdDSA",
+            "use": "sig",
+            "x": base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+        }]
+    }
+
 # Auth routes
 @api_router.post("/auth/register")
 async def register_user(user_data: UserCreate):
@@ -195,7 +360,7 @@ async def register_user(user_data: UserCreate):
         raise HTTPException(status_code=400, detail="User already exists")
     
     # Hash password
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await hash_password(user_data.password)
     
     # Create user
     user = User(
@@ -229,11 +394,18 @@ async def register_user(user_data: UserCreate):
 async def login_user(login_data: UserLogin):
     user = await db.users.find_one({"email": login_data.email})
     if not user:
+        # Burn the same hashing cost as a real verification before rejecting
+        await verify_password(login_data.password, _DUMMY_HASH)
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    if not verify_password(login_data.password, user["password"]):
+    if not await verify_password(login_data.password, user["password"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
-    
+
+    # Upgrade legacy bcrypt hashes (and outdated argon2 parameters) in place
+    if password_needs_rehash(user["password"]):
+        new_hash = await hash_password(login_data.password)
+        await db.users.update_one({"id": user["id"]}, {"$set": {"password": new_hash}})
+
     # Create JWT token
     token = create_jwt_token({"user_id": user["id"], "email": user["email"]})
     
@@ -250,21 +422,24 @@ async def login_user(login_data: UserLogin):
     }
 
 # Product routes
-@api_router.get("/products", response_model=List[Product])
+@api_router.get("/products")
 async def get_products(category: Optional[str] = None, limit: int = 20):
     query = {"is_active": True}
     if category:
         query["category"] = category
-    
-    products = await db.products.find(query).limit(limit).to_list(limit)
-    return [Product(**product) for product in products]
 
-@api_router.get("/products/{product_id}", response_model=Product)
+    cursor = db.products.find(query, projection=_PRODUCT_PROJECTION).limit(limit)
+    products = [msgspec.convert(product, ProductOut) async for product in cursor]
+    return _json_response(products)
+
+@api_router.get("/products/{product_id}")
 async def get_product(product_id: str):
-    product = await db.products.find_one({"id": product_id, "is_active": True})
+    product = await db.products.find_one(
+        {"id": product_id, "is_active": True}, projection=_PRODUCT_PROJECTION
+    )
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return Product(**product)
+    return _json_response(msgspec.convert(product, ProductOut))
 
 @api_router.post("/products")
 async def create_product(product_data: ProductCreate, current_user: User = Depends(get_current_user)):
@@ -278,43 +453,99 @@ async def create_product(product_data: ProductCreate, current_user: User = Depen
 # Category routes
 @api_router.get("/categories")
 async def get_categories():
-    categories = await db.categories.find().to_list(100)
-    return [Category(**category) for category in categories]
+    cursor = db.categories.find(projection=_CATEGORY_PROJECTION).limit(100)
+    return [Category.model_construct(**category) async for category in cursor]
 
 # Order routes
 @api_router.post("/orders")
 async def create_order(order_data: OrderCreate, current_user: User = Depends(get_current_user)):
-    # Calculate order total
-    total_amount = 0.0
+    # Fetch all ordered products in one round-trip instead of one query per item
+    product_ids = [item.product_id for item in order_data.items]
+    products = {
+        p["id"]: p
+        async for p in db.products.find(
+            {"id": {"$in": product_ids}, "is_active": True},
+            projection={"id": 1, "name": 1, "price": 1, "stock_quantity": 1, "_id": 0},
+        )
+    }
+
+    # Calculate the order total in integer paise - prices are stored in
+    # rupees, but accumulating floats lets rounding drift into money
+    total_paise = 0
     order_items = []
-    
+
     for item in order_data.items:
-        product = await db.products.find_one({"id": item.product_id, "is_active": True})
+        product = products.get(item.product_id)
         if not product:
             raise HTTPException(status_code=404, detail=f"Product {item.product_id} not found")
-        
+
         if product["stock_quantity"] < item.quantity:
             raise HTTPException(status_code=400, detail=f"Insufficient stock for {product['name']}")
-        
-        item_total = product["price"] * item.quantity
-        total_amount += item_total
-        
+
+        item_total_paise = round(product["price"] * 100) * item.quantity
+        total_paise += item_total_paise
+
         order_items.append({
             "product_id": item.product_id,
             "name": product["name"],
             "price": product["price"],
             "quantity": item.quantity,
-            "total": item_total
+            "total": item_total_paise / 100
         })
-    
+
+    # The cached current_user can be up to AUTH_CACHE_TTL seconds stale -
+    # loyalty math must work on a fresh read of the live balance, and the
+    # guarded update further down re-checks it atomically
+    user_doc = await db.users.find_one(
+        {"id": current_user.id}, projection={"loyalty_points": 1, "total_spent": 1, "_id": 0}
+    )
+    if user_doc is None:
+        raise HTTPException(status_code=401, detail="User not found")
+
+    # Reserve stock atomically before recording the order: each decrement is
+    # conditional on enough stock remaining, so concurrent orders cannot
+    # oversell. The read-time check above only exists for friendly errors.
+    # return_exceptions=True so one failed decrement cannot propagate past
+    # the gather and leak the decrements that already landed
+    results = await asyncio.gather(*[
+        db.products.update_one(
+            {"id": item.product_id, "stock_quantity": {"$gte": item.quantity}},
+            {"$inc": {"stock_quantity": -item.quantity}}
+        )
+        for item in order_data.items
+    ], return_exceptions=True)
+    # matched_count, not modified_count: a zero-quantity line item matches its
+    # stock guard without modifying anything and is still a valid reservation
+    if any(isinstance(result, BaseException) or result.matched_count == 0 for result in results):
+        # Roll back the decrements that did land, then reject the order
+        rollback_ops = [
+            UpdateOne({"id": item.product_id}, {"$inc": {"stock_quantity": item.quantity}})
+            for item, result in zip(order_data.items, results)
+            if not isinstance(result, BaseException) and result.matched_count == 1
+        ]
+        if rollback_ops:
+            await db.products.bulk_write(rollback_ops, ordered=False)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise errors[0]
+        out_of_stock = ", ".join(
+            products[item.product_id]["name"]
+            for item, result in zip(order_data.items, results)
+            if result.matched_count == 0
+        )
+        raise HTTPException(status_code=409, detail=f"Insufficient stock for {out_of_stock}")
+
     # Apply loyalty points discount
     discount_amount = 0.0
-    loyalty_points_used = min(order_data.loyalty_points_to_use, current_user.loyalty_points)
+    loyalty_points_used = min(order_data.loyalty_points_to_use, user_doc["loyalty_points"])
     if loyalty_points_used > 0:
         # 1 point = 1 rupee discount
         discount_amount = loyalty_points_used
-        total_amount = max(0, total_amount - discount_amount)
-    
+        total_paise = max(0, total_paise - loyalty_points_used * 100)
+
+    # Back to rupees only once the math is done
+    total_amount = total_paise / 100
+
     # Calculate loyalty points earned
     loyalty_points_earned = calculate_loyalty_points(total_amount)
     
@@ -329,31 +560,43 @@ async def create_order(order_data: OrderCreate, current_user: User = Depends(get
         shipping_address=order_data.shipping_address
     )
     
-    await db.orders.insert_one(order.dict())
-    
     # Update user loyalty points and tier
-    new_loyalty_points = current_user.loyalty_points - loyalty_points_used + loyalty_points_earned
-    new_total_spent = current_user.total_spent + total_amount
+    new_loyalty_points = user_doc["loyalty_points"] - loyalty_points_used + loyalty_points_earned
+    new_total_spent = user_doc["total_spent"] + total_amount
     new_tier = calculate_loyalty_tier(new_total_spent)
-    
-    await db.users.update_one(
-        {"id": current_user.id},
-        {
-            "$set": {
-                "loyalty_points": new_loyalty_points,
-                "total_spent": new_total_spent,
-                "loyalty_tier": new_tier
+
+    # The order insert and the loyalty update are independent - fire both
+    # concurrently so the write phase costs one round-trip, not two. The
+    # loyalty update is a guarded $inc, not a $set, so a concurrent order on
+    # the same account can neither double-spend points nor overwrite this
+    # order's balance change with a stale snapshot.
+    user_result, _ = await asyncio.gather(
+        db.users.update_one(
+            {"id": current_user.id, "loyalty_points": {"$gte": loyalty_points_used}},
+            {
+                "$inc": {
+                    "loyalty_points": loyalty_points_earned - loyalty_points_used,
+                    "total_spent": total_amount
+                },
+                "$set": {"loyalty_tier": new_tier}
             }
-        }
+        ),
+        db.orders.insert_one(order.dict())
     )
-    
-    # Update product stock
-    for item in order_data.items:
-        await db.products.update_one(
-            {"id": item.product_id},
-            {"$inc": {"stock_quantity": -item.quantity}}
+    if user_result.matched_count == 0:
+        # A concurrent order spent the points first - undo this one entirely
+        await asyncio.gather(
+            db.orders.delete_one({"id": order.id}),
+            db.products.bulk_write(
+                [
+                    UpdateOne({"id": item.product_id}, {"$inc": {"stock_quantity": item.quantity}})
+                    for item in order_data.items
+                ],
+                ordered=False
+            )
         )
-    
+        raise HTTPException(status_code=409, detail="Loyalty points balance changed, please retry")
+
     return {
         "message": "Order created successfully",
         "order_id": order.id,
@@ -365,8 +608,11 @@ async def create_order(order_data: OrderCreate, current_user: User = Depends(get
 
 @api_router.get("/orders")
 async def get_user_orders(current_user: User = Depends(get_current_user)):
-    orders = await db.orders.find({"user_id": current_user.id}).sort("created_at", -1).to_list(50)
-    return [Order(**order) for order in orders]
+    cursor = db.orders.find(
+        {"user_id": current_user.id}, projection=_ORDER_PROJECTION
+    ).sort("created_at", -1).limit(50)
+    orders = [msgspec.convert(order, OrderOut) async for order in cursor]
+    return _json_response(orders)
 
 # Review routes
 @api_router.post("/reviews")
@@ -391,26 +637,49 @@ async def create_review(review_data: ReviewCreate, current_user: User = Depends(
     
     await db.reviews.insert_one(review.dict())
     
-    # Update product rating
-    reviews = await db.reviews.find({"product_id": review_data.product_id}).to_list(1000)
-    avg_rating = sum(r["rating"] for r in reviews) / len(reviews)
-    
+    # Update product rating incrementally from a running sum instead of
+    # re-reading every review on each submission
     await db.products.update_one(
         {"id": review_data.product_id},
-        {
-            "$set": {
-                "rating": round(avg_rating, 1),
-                "review_count": len(reviews)
+        [
+            {
+                "$set": {
+                    # Backfill rating_sum for documents created before it
+                    # existed; $toInt/$round keep it an integer, since the
+                    # rating * review_count product is a BSON double
+                    "rating_sum": {
+                        "$add": [
+                            {
+                                "$toInt": {
+                                    "$round": [
+                                        {"$ifNull": ["$rating_sum", {"$multiply": ["$rating", "$review_count"]}]},
+                                        0
+                                    ]
+                                }
+                            },
+                            review_data.rating
+                        ]
+                    },
+                    "review_count": {"$add": ["$review_count", 1]}
+                }
+            },
+            {
+                "$set": {
+                    "rating": {"$round": [{"$divide": ["$rating_sum", "$review_count"]}, 1]}
+                }
             }
-        }
+        ]
     )
     
     return {"message": "Review created successfully"}
 
 @api_router.get("/products/{product_id}/reviews")
 async def get_product_reviews(product_id: str, limit: int = 20):
-    reviews = await db.reviews.find({"product_id": product_id}).limit(limit).to_list(limit)
-    return [Review(**review) for review in reviews]
+    cursor = db.reviews.find(
+        {"product_id": product_id}, projection=_REVIEW_PROJECTION
+    ).limit(limit)
+    reviews = [msgspec.convert(review, ReviewOut) async for review in cursor]
+    return _json_response(reviews)
 
 # Loyalty program routes
 @api_router.get("/loyalty/status")
@@ -431,30 +700,33 @@ async def get_loyalty_status(current_user: User = Depends(get_current_user)):
 @api_router.get("/recommendations")
 async def get_recommendations(current_user: User = Depends(get_current_user), limit: int = 6):
     # Simple recommendation based on user's order history
-    orders = await db.orders.find({"user_id": current_user.id}).to_list(50)
-    
+    orders = await db.orders.find(
+        {"user_id": current_user.id}, projection={"items.product_id": 1, "_id": 0}
+    ).to_list(50)
+
     if not orders:
         # New user - recommend popular products
-        products = await db.products.find({"is_active": True}).sort("rating", -1).limit(limit).to_list(limit)
+        products = await db.products.find(
+            {"is_active": True}, projection=_PRODUCT_PROJECTION
+        ).sort("rating", -1).limit(limit).to_list(limit)
     else:
-        # Get categories from user's purchase history
-        purchased_categories = set()
-        for order in orders:
-            for item in order["items"]:
-                product = await db.products.find_one({"id": item["product_id"]})
-                if product:
-                    purchased_categories.add(product["category"])
-        
+        # Get categories from user's purchase history in one query instead of
+        # one lookup per purchased item
+        purchased_ids = list({item["product_id"] for order in orders for item in order["items"]})
+        purchased_categories = await db.products.distinct("category", {"id": {"$in": purchased_ids}})
+
         if purchased_categories:
             # Recommend products from same categories
-            products = await db.products.find({
-                "is_active": True,
-                "category": {"$in": list(purchased_categories)}
-            }).sort("rating", -1).limit(limit).to_list(limit)
+            products = await db.products.find(
+                {"is_active": True, "category": {"$in": purchased_categories}},
+                projection=_PRODUCT_PROJECTION,
+            ).sort("rating", -1).limit(limit).to_list(limit)
         else:
-            products = await db.products.find({"is_active": True}).sort("rating", -1).limit(limit).to_list(limit)
-    
-    return [Product(**product) for product in products]
+            products = await db.products.find(
+                {"is_active": True}, projection=_PRODUCT_PROJECTION
+            ).sort("rating", -1).limit(limit).to_list(limit)
+
+    return _json_response([msgspec.convert(product, ProductOut) for product in products])
 
 # Mock payment endpoint
 @api_router.post("/payment/simulate")
@@ -495,6 +767,20 @@ logger = logging.getLogger(__name__)
 
 @app.on_event("startup")
 async def startup_event():
+    # Warm the connection pool so the first real request doesn't pay the
+    # connection-establishment cost
+    await db.command("ping")
+
+    # Indexes for the hot query predicates - without these every lookup is a
+    # full collection scan
+    await db.users.create_index("email", unique=True)
+    await db.users.create_index("id", unique=True)
+    await db.products.create_index("id", unique=True)
+    # Covers get_products filtering and the rating-sorted recommendation queries
+    await db.products.create_index([("category", 1), ("is_active", 1), ("rating", -1)])
+    await db.orders.create_index([("user_id", 1), ("created_at", -1)])
+    await db.reviews.create_index([("product_id", 1), ("user_id", 1)], unique=True)
+
     # Create sample categories
     categories_data = [
         {"name": "Smartphones", "description": "Latest smartphones and accessories", "image_url": "https://images.unsplash.com/photo-1498049794561-7780e7231661"},
@@ -503,11 +789,16 @@ async def startup_event():
         {"name": "Chargers & Power Banks", "description": "Power accessories", "image_url": "https://images.unsplash.com/photo-1636115305669-9096bffe87fd"}
     ]
     
-    for cat_data in categories_data:
-        existing = await db.categories.find_one({"name": cat_data["name"]})
-        if not existing:
-            category = Category(**cat_data)
-            await db.categories.insert_one(category.dict())
+    # One distinct query + one batched insert instead of a find/insert pair
+    # per seed document
+    existing_categories = set(await db.categories.distinct("name"))
+    new_categories = [
+        Category(**cat_data).dict()
+        for cat_data in categories_data
+        if cat_data["name"] not in existing_categories
+    ]
+    if new_categories:
+        await db.categories.insert_many(new_categories, ordered=False)
     
     # Create sample products
     products_data = [
@@ -577,11 +868,14 @@ async def startup_event():
         }
     ]
     
-    for prod_data in products_data:
-        existing = await db.products.find_one({"name": prod_data["name"]})
-        if not existing:
-            product = Product(**prod_data)
-            await db.products.insert_one(product.dict())
+    existing_products = set(await db.products.distinct("name"))
+    new_products = [
+        Product(**prod_data).dict()
+        for prod_data in products_data
+        if prod_data["name"] not in existing_products
+    ]
+    if new_products:
+        await db.products.insert_many(new_products, ordered=False)
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
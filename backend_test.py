@@ -1,280 +1,353 @@
-import requests
-import sys
+import asyncio
+import io
 import json
-from datetime import datetime
+import logging
+import socket
+import sys
+import time
+
+import httpx
+import orjson
+
+# One buffered handler: batched writes instead of a syscall per print, and
+# each test's block is emitted in a single call so concurrently running
+# tests cannot interleave their output
+log = logging.getLogger("backend_test")
+_handler = logging.StreamHandler(
+    io.TextIOWrapper(sys.stdout.buffer, write_through=False, line_buffering=False)
+)
+_handler.setFormatter(logging.Formatter('%(message)s'))
+log.addHandler(_handler)
+log.setLevel(logging.INFO)
+
+# Small-JSON exchanges suffer most from Nagle's 40ms coalescing delay and
+# idle connections being dropped between dependent tests - set the socket
+# options explicitly instead of trusting OS defaults
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20),
+    (socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20),
+]
 
 class ElectroMartAPITester:
+    # Expected response shapes as frozensets so the field checks run as a
+    # single C-level set difference instead of a Python loop per item
+    _REQ_PRODUCT_FIELDS = frozenset({'id', 'name', 'price', 'brand', 'category', 'image_url'})
+    _REQ_LOYALTY_FIELDS = frozenset({'points', 'tier', 'total_spent', 'benefits'})
+    _EXPECTED_TIERS = frozenset({'bronze', 'silver', 'gold', 'platinum'})
+    _EXPECTED_CATEGORIES = frozenset({"Smartphones", "Headphones", "Smartwatches", "Chargers & Power Banks"})
+
     def __init__(self, base_url="https://45f387d2-a8b8-4ede-8376-a9f01a081d72.preview.emergentagent.com/api"):
         self.base_url = base_url
         self.token = None
         self.user_id = None
         self.tests_run = 0
         self.tests_passed = 0
-        self.test_user_email = f"test_user_{datetime.now().strftime('%H%M%S')}@test.com"
+        self.tests_skipped = 0
+        # Nanosecond suffix cannot collide across rapid reruns the way the
+        # old second-resolution timestamp could
+        self.test_user_email = f"test_user_{time.time_ns()}@test.com"
         self.test_user_password = "TestPass123!"
+        # httpx async client, created inside the event loop by run_all_tests
+        self.client = None
+        # Caps in-flight requests the way a small worker pool would, so
+        # gathered test groups cannot stampede the preview host
+        self._concurrency = asyncio.Semaphore(4)
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
-        """Run a single API test"""
-        url = f"{self.base_url}/{endpoint}" if not endpoint.startswith('http') else endpoint
-        test_headers = {'Content-Type': 'application/json'}
-        
-        if self.token:
-            test_headers['Authorization'] = f'Bearer {self.token}'
-        
-        if headers:
-            test_headers.update(headers)
+        # Shared immutable header base plus pre-serialized auth payloads -
+        # registration and login reuse the same bodies, so encode them once
+        # and hand the raw bytes straight to the client
+        self._base_headers = {'Content-Type': 'application/json'}
+        self._reg_body = json.dumps({
+            "name": "Test User",
+            "email": self.test_user_email,
+            "password": self.test_user_password,
+            "phone": "9876543210"
+        }).encode('utf-8')
+        self._login_body = json.dumps({
+            "email": self.test_user_email,
+            "password": self.test_user_password
+        }).encode('utf-8')
+
+    def _set_token(self, token):
+        """Point self.token and the client's Authorization header at token"""
+        self.token = token
+        if self.client is None:
+            return
+        if token:
+            self.client.headers['Authorization'] = f'Bearer {token}'
+        else:
+            self.client.headers.pop('Authorization', None)
 
+    async def run_test(self, name, method, endpoint, expected_status, data=None, headers=None, body=None):
+        """Run a single API test"""
+        # No URL join here: the client's base_url merges the endpoint in C
         self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
-        print(f"   URL: {url}")
-        
+        lines = [f"\n🔍 Testing {name}...", f"   Endpoint: {self.base_url}/{endpoint}"]
+
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=test_headers, timeout=10)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=test_headers, timeout=10)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=test_headers, timeout=10)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=test_headers, timeout=10)
+            async with self._concurrency:
+                if body is not None:
+                    # Pre-encoded bytes skip the per-call json.dumps entirely
+                    response = await self.client.request(method, endpoint, content=body, headers=headers)
+                else:
+                    response = await self.client.request(method, endpoint, json=data, headers=headers)
 
             success = response.status_code == expected_status
             if success:
                 self.tests_passed += 1
-                print(f"✅ Passed - Status: {response.status_code}")
+                lines.append(f"✅ Passed - Status: {response.status_code}")
                 try:
-                    response_data = response.json()
-                    if isinstance(response_data, dict) and len(str(response_data)) < 500:
-                        print(f"   Response: {response_data}")
+                    # orjson decodes the raw bytes without the stdlib parser,
+                    # and the size gate reads content length instead of
+                    # stringifying the whole payload
+                    response_data = orjson.loads(response.content)
+                    if isinstance(response_data, dict) and len(response.content) < 500:
+                        lines.append(f"   Response: {response_data}")
                     elif isinstance(response_data, list):
-                        print(f"   Response: List with {len(response_data)} items")
+                        lines.append(f"   Response: List with {len(response_data)} items")
                     return True, response_data
-                except:
+                except orjson.JSONDecodeError:
                     return True, {}
             else:
-                print(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
+                lines.append(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
                 try:
-                    error_data = response.json()
-                    print(f"   Error: {error_data}")
-                except:
-                    print(f"   Error: {response.text}")
+                    error_data = orjson.loads(response.content)
+                    lines.append(f"   Error: {error_data}")
+                except orjson.JSONDecodeError:
+                    lines.append(f"   Error: {response.text}")
                 return False, {}
 
         except Exception as e:
-            print(f"❌ Failed - Error: {str(e)}")
+            lines.append(f"❌ Failed - Error: {str(e)}")
             return False, {}
+        finally:
+            # One write per test keeps the block contiguous under gather
+            log.info("\n".join(lines))
 
-    def test_root_endpoint(self):
+    async def test_root_endpoint(self):
         """Test root API endpoint"""
-        return self.run_test("Root API Endpoint", "GET", "", 200)
+        return await self.run_test("Root API Endpoint", "GET", "", 200)
 
-    def test_user_registration(self):
+    async def test_user_registration(self):
         """Test user registration with welcome bonus"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "User Registration",
             "POST",
             "auth/register",
             200,
-            data={
-                "name": "Test User",
-                "email": self.test_user_email,
-                "password": self.test_user_password,
-                "phone": "9876543210"
-            }
+            body=self._reg_body
         )
-        
+
         if success and 'token' in response:
-            self.token = response['token']
+            self._set_token(response['token'])
             self.user_id = response['user']['id']
-            
+
             # Check welcome bonus
             if response['user']['loyalty_points'] == 100:
-                print("✅ Welcome bonus of 100 points awarded correctly")
+                log.info("✅ Welcome bonus of 100 points awarded correctly")
             else:
-                print(f"❌ Welcome bonus incorrect: {response['user']['loyalty_points']} points")
-            
+                log.info(f"❌ Welcome bonus incorrect: {response['user']['loyalty_points']} points")
+
             # Check initial tier
             if response['user']['loyalty_tier'] == 'bronze':
-                print("✅ Initial loyalty tier set to Bronze correctly")
+                log.info("✅ Initial loyalty tier set to Bronze correctly")
             else:
-                print(f"❌ Initial loyalty tier incorrect: {response['user']['loyalty_tier']}")
-                
+                log.info(f"❌ Initial loyalty tier incorrect: {response['user']['loyalty_tier']}")
+
             return True
         return False
 
-    def test_user_login(self):
+    async def test_user_login(self):
         """Test user login"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "User Login",
             "POST",
             "auth/login",
             200,
-            data={
-                "email": self.test_user_email,
-                "password": self.test_user_password
-            }
+            body=self._login_body
         )
-        
+
         if success and 'token' in response:
-            self.token = response['token']
+            self._set_token(response['token'])
             self.user_id = response['user']['id']
             return True
         return False
 
-    def test_get_products(self):
-        """Test getting all products"""
-        success, response = self.run_test("Get Products", "GET", "products", 200)
-        
+    async def test_get_products(self):
+        """Test getting a page of products"""
+        # The test only samples the first two items, so cap the page server-
+        # side instead of downloading and parsing the whole catalog
+        success, response = await self.run_test("Get Products", "GET", "products?limit=5", 200)
+
         if success and isinstance(response, list):
-            print(f"✅ Found {len(response)} products")
-            
+            log.info(f"✅ Found {len(response)} products (first page)")
+
             # Check if products have required fields and Indian pricing
             for product in response[:2]:  # Check first 2 products
-                required_fields = ['id', 'name', 'price', 'brand', 'category', 'image_url']
-                missing_fields = [field for field in required_fields if field not in product]
-                
+                missing_fields = self._REQ_PRODUCT_FIELDS.difference(product)
+
                 if missing_fields:
-                    print(f"❌ Product missing fields: {missing_fields}")
+                    log.info(f"❌ Product missing fields: {sorted(missing_fields)}")
                 else:
-                    print(f"✅ Product '{product['name']}' has all required fields")
-                    print(f"   Price: ₹{product['price']} (Brand: {product['brand']})")
-            
+                    log.info(f"✅ Product '{product['name']}' has all required fields")
+                    log.info(f"   Price: ₹{product['price']} (Brand: {product['brand']})")
+
             return True
         return False
 
-    def test_get_categories(self):
+    async def test_get_categories(self):
         """Test getting all categories"""
-        success, response = self.run_test("Get Categories", "GET", "categories", 200)
-        
+        success, response = await self.run_test("Get Categories", "GET", "categories", 200)
+
         if success and isinstance(response, list):
-            print(f"✅ Found {len(response)} categories")
-            
-            expected_categories = ["Smartphones", "Headphones", "Smartwatches", "Chargers & Power Banks"]
-            found_categories = [cat['name'] for cat in response]
-            
-            for expected in expected_categories:
+            log.info(f"✅ Found {len(response)} categories")
+
+            found_categories = {cat['name'] for cat in response}
+
+            for expected in sorted(self._EXPECTED_CATEGORIES):
                 if expected in found_categories:
-                    print(f"✅ Category '{expected}' found")
+                    log.info(f"✅ Category '{expected}' found")
                 else:
-                    print(f"❌ Category '{expected}' missing")
-            
+                    log.info(f"❌ Category '{expected}' missing")
+
             return True
         return False
 
-    def test_loyalty_status(self):
+    async def test_loyalty_status(self):
         """Test loyalty status endpoint (requires authentication)"""
         if not self.token:
-            print("❌ No token available for loyalty status test")
-            return False
-            
-        success, response = self.run_test("Loyalty Status", "GET", "loyalty/status", 200)
-        
+            # Skipped, not failed: no request is issued and no counter burns
+            self.tests_skipped += 1
+            return None
+
+        success, response = await self.run_test("Loyalty Status", "GET", "loyalty/status", 200)
+
         if success:
-            required_fields = ['points', 'tier', 'total_spent', 'benefits']
-            missing_fields = [field for field in required_fields if field not in response]
-            
+            missing_fields = self._REQ_LOYALTY_FIELDS.difference(response)
+
             if missing_fields:
-                print(f"❌ Loyalty status missing fields: {missing_fields}")
+                log.info(f"❌ Loyalty status missing fields: {sorted(missing_fields)}")
                 return False
             else:
-                print(f"✅ Loyalty status complete:")
-                print(f"   Points: {response['points']}")
-                print(f"   Tier: {response['tier']}")
-                print(f"   Total Spent: ₹{response['total_spent']}")
-                
+                log.info(f"✅ Loyalty status complete:")
+                log.info(f"   Points: {response['points']}")
+                log.info(f"   Tier: {response['tier']}")
+                log.info(f"   Total Spent: ₹{response['total_spent']}")
+
                 # Check if benefits structure is correct
                 benefits = response['benefits']
-                expected_tiers = ['bronze', 'silver', 'gold', 'platinum']
-                
-                for tier in expected_tiers:
+
+                for tier in sorted(self._EXPECTED_TIERS):
                     if tier in benefits:
-                        print(f"✅ {tier.capitalize()} tier benefits available")
+                        log.info(f"✅ {tier.capitalize()} tier benefits available")
                     else:
-                        print(f"❌ {tier.capitalize()} tier benefits missing")
-                
+                        log.info(f"❌ {tier.capitalize()} tier benefits missing")
+
                 return True
         return False
 
-    def test_get_orders(self):
+    async def test_get_orders(self):
         """Test getting user orders (requires authentication)"""
         if not self.token:
-            print("❌ No token available for orders test")
-            return False
-            
-        success, response = self.run_test("Get User Orders", "GET", "orders", 200)
-        
+            # Skipped, not failed: no request is issued and no counter burns
+            self.tests_skipped += 1
+            return None
+
+        success, response = await self.run_test("Get User Orders", "GET", "orders", 200)
+
         if success:
             if isinstance(response, list):
-                print(f"✅ Orders endpoint working - {len(response)} orders found")
+                log.info(f"✅ Orders endpoint working - {len(response)} orders found")
                 return True
             else:
-                print("❌ Orders response is not a list")
+                log.info("❌ Orders response is not a list")
                 return False
         return False
 
-    def test_recommendations(self):
+    async def test_recommendations(self):
         """Test recommendations endpoint (requires authentication)"""
         if not self.token:
-            print("❌ No token available for recommendations test")
-            return False
-            
-        success, response = self.run_test("Get Recommendations", "GET", "recommendations", 200)
-        
+            # Skipped, not failed: no request is issued and no counter burns
+            self.tests_skipped += 1
+            return None
+
+        success, response = await self.run_test("Get Recommendations", "GET", "recommendations?limit=6", 200)
+
         if success and isinstance(response, list):
-            print(f"✅ Recommendations working - {len(response)} products recommended")
+            log.info(f"✅ Recommendations working - {len(response)} products recommended")
             return True
         return False
 
-    def test_invalid_auth(self):
+    async def test_invalid_auth(self):
         """Test endpoints with invalid authentication"""
         # Save current token
         original_token = self.token
-        self.token = "invalid_token_123"
-        
-        success, _ = self.run_test("Invalid Auth Test", "GET", "loyalty/status", 401)
-        
+        self._set_token("invalid_token_123")
+
+        success, _ = await self.run_test("Invalid Auth Test", "GET", "loyalty/status", 401)
+
         # Restore original token
-        self.token = original_token
+        self._set_token(original_token)
         return success
 
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all API tests"""
-        print("🚀 Starting ElectroMart API Tests")
-        print("=" * 50)
-        
-        # Test basic endpoints
-        self.test_root_endpoint()
-        self.test_get_products()
-        self.test_get_categories()
-        
-        # Test authentication
-        if self.test_user_registration():
-            print("\n📝 Registration successful, testing authenticated endpoints...")
-            self.test_loyalty_status()
-            self.test_get_orders()
-            self.test_recommendations()
-            
-            # Test login with same user
-            print("\n🔐 Testing login with registered user...")
-            self.test_user_login()
-        
-        # Test invalid authentication
-        self.test_invalid_auth()
-        
+        log.info("🚀 Starting ElectroMart API Tests")
+        log.info("=" * 50)
+
+        # HTTP/2 multiplexes every test over one TLS connection, so even
+        # sequential tests skip per-request handshakes and head-of-line waits
+        limits = httpx.Limits(max_connections=8, max_keepalive_connections=8, keepalive_expiry=30)
+        transport = httpx.AsyncHTTPTransport(
+            http2=True, limits=limits, socket_options=_SOCKET_OPTIONS
+        )
+        async with httpx.AsyncClient(
+            base_url=self.base_url, timeout=10.0, transport=transport,
+            headers=self._base_headers
+        ) as client:
+            self.client = client
+
+            # Independent read-only endpoints: overlap their round-trips
+            await asyncio.gather(
+                self.test_root_endpoint(),
+                self.test_get_products(),
+                self.test_get_categories(),
+            )
+
+            # Test authentication
+            if await self.test_user_registration():
+                log.info("\n📝 Registration successful, testing authenticated endpoints...")
+                await asyncio.gather(
+                    self.test_loyalty_status(),
+                    self.test_get_orders(),
+                    self.test_recommendations(),
+                )
+
+                # Test login with same user
+                log.info("\n🔐 Testing login with registered user...")
+                await self.test_user_login()
+
+            # Test invalid authentication
+            await self.test_invalid_auth()
+
         # Print final results
-        print("\n" + "=" * 50)
-        print(f"📊 Test Results: {self.tests_passed}/{self.tests_run} tests passed")
-        
+        log.info("\n" + "=" * 50)
+        log.info(f"📊 Test Results: {self.tests_passed}/{self.tests_run} tests passed")
+        if self.tests_skipped:
+            log.info(f"⏭️  {self.tests_skipped} tests skipped (no authenticated session)")
+
         if self.tests_passed == self.tests_run:
-            print("🎉 All tests passed! Backend API is working correctly.")
+            log.info("🎉 All tests passed! Backend API is working correctly.")
             return 0
         else:
-            print(f"⚠️  {self.tests_run - self.tests_passed} tests failed. Please check the issues above.")
+            log.info(f"⚠️  {self.tests_run - self.tests_passed} tests failed. Please check the issues above.")
             return 1
 
 def main():
     tester = ElectroMartAPITester()
-    return tester.run_all_tests()
+    return asyncio.run(tester.run_all_tests())
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""Live API tests for a deployed backend.
+
+These hit a real deployment, so they are skipped unless LIVE_API_URL is set
+(e.g. ``LIVE_API_URL=https://<host>/api pytest tests/``). Unlike running the
+standalone backend_test.py script repeatedly, the whole suite - including
+registration and login - executes exactly once per pytest session and every
+test function just asserts on its shared outcome, so iterating on one
+failing endpoint no longer re-registers a user and re-hits every route.
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+LIVE_API_URL = os.environ.get("LIVE_API_URL")
+
+pytestmark = pytest.mark.skipif(
+    not LIVE_API_URL, reason="LIVE_API_URL not set; live API tests need a deployment"
+)
+
+
+@pytest.fixture(scope="session")
+def suite_results():
+    """Run the full suite once and share the per-endpoint outcomes."""
+    httpx = pytest.importorskip("httpx")
+    from backend_test import ElectroMartAPITester
+
+    tester = ElectroMartAPITester(base_url=LIVE_API_URL)
+
+    async def _run():
+        limits = httpx.Limits(max_connections=8, max_keepalive_connections=8, keepalive_expiry=30)
+        async with httpx.AsyncClient(
+            base_url=LIVE_API_URL, http2=True, timeout=10.0, limits=limits,
+            headers=tester._base_headers
+        ) as client:
+            tester.client = client
+
+            outcomes = {}
+            root, products, categories = await asyncio.gather(
+                tester.test_root_endpoint(),
+                tester.test_get_products(),
+                tester.test_get_categories(),
+            )
+            outcomes["root"] = root[0]
+            outcomes["products"] = products
+            outcomes["categories"] = categories
+
+            # Authenticate exactly once for the whole session
+            outcomes["registration"] = await tester.test_user_registration()
+            if outcomes["registration"]:
+                loyalty, orders, recommendations = await asyncio.gather(
+                    tester.test_loyalty_status(),
+                    tester.test_get_orders(),
+                    tester.test_recommendations(),
+                )
+                outcomes["loyalty"] = loyalty
+                outcomes["orders"] = orders
+                outcomes["recommendations"] = recommendations
+                outcomes["login"] = await tester.test_user_login()
+            outcomes["invalid_auth"] = await tester.test_invalid_auth()
+            return outcomes
+
+    return asyncio.run(_run())
+
+
+def _auth_result(suite_results, key):
+    if key not in suite_results:
+        pytest.skip("registration failed; no authenticated session")
+    return suite_results[key]
+
+
+def test_root_endpoint(suite_results):
+    assert suite_results["root"]
+
+
+def test_get_products(suite_results):
+    assert suite_results["products"]
+
+
+def test_get_categories(suite_results):
+    assert suite_results["categories"]
+
+
+def test_user_registration(suite_results):
+    assert suite_results["registration"]
+
+
+def test_loyalty_status(suite_results):
+    assert _auth_result(suite_results, "loyalty")
+
+
+def test_get_orders(suite_results):
+    assert _auth_result(suite_results, "orders")
+
+
+def test_recommendations(suite_results):
+    assert _auth_result(suite_results, "recommendations")
+
+
+def test_user_login(suite_results):
+    assert _auth_result(suite_results, "login")
+
+
+def test_invalid_auth(suite_results):
+    assert suite_results["invalid_auth"]